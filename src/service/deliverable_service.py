@@ -12,6 +12,19 @@ from src.repository.db.models import DeliverableModel
 
 logger = logging.getLogger(__name__)
 
+NAME_PATTERNS = tuple(
+    re.compile(pattern, re.MULTILINE)
+    for pattern in (
+        r"(?:Name|Student|Author|Submitted by|By|Student Name)[\s:]*([A-Z][a-zA-Z]+(?:[ \t]+[A-Z][a-zA-Z]+){1,3})",
+        r"^([A-Z][a-zA-Z]+(?:[ \t]+[A-Z][a-zA-Z]+){1,3})$",
+        r"^([A-Z][a-zA-Z]+(?:[ \t]+[A-Z][a-zA-Z]+){1,3})[ \t]*\n",
+        r"(?:Prepared by|Written by|Created by)[\s:]*([A-Z][a-zA-Z]+(?:[ \t]+[A-Z][a-zA-Z]+){1,3})",
+    )
+)
+INVALID_NAME_CHARS_PATTERN = re.compile(r"[^a-zA-Z0-9\s\-\'\.]")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+LETTER_PATTERN = re.compile(r"[a-zA-Z]")
+
 
 class DeliverableService:
     """Service for handling deliverable operations."""
@@ -129,10 +142,10 @@ class DeliverableService:
             if name.lower().startswith(prefix.lower()):
                 name = name[len(prefix) :].strip()
 
-        name = re.sub(r"[^a-zA-Z0-9\s\-\'\.]", " ", name)
-        name = re.sub(r"\s+", " ", name).strip()
+        name = INVALID_NAME_CHARS_PATTERN.sub(" ", name)
+        name = WHITESPACE_PATTERN.sub(" ", name).strip()
 
-        if not re.search(r"[a-zA-Z]", name):
+        if not LETTER_PATTERN.search(name):
             return "Unknown"
 
         if len(name) < 2 or name.replace(" ", "").isdigit():
@@ -148,15 +161,8 @@ class DeliverableService:
         if not text:
             return "Unknown"
 
-        patterns = [
-            r"(?:Name|Student|Author|Submitted by|By|Student Name)[\s:]*([A-Z][a-zA-Z]+(?:[ \t]+[A-Z][a-zA-Z]+){1,3})",
-            r"^([A-Z][a-zA-Z]+(?:[ \t]+[A-Z][a-zA-Z]+){1,3})$",
-            r"^([A-Z][a-zA-Z]+(?:[ \t]+[A-Z][a-zA-Z]+){1,3})[ \t]*\n",
-            r"(?:Prepared by|Written by|Created by)[\s:]*([A-Z][a-zA-Z]+(?:[ \t]+[A-Z][a-zA-Z]+){1,3})",
-        ]
-
-        for pattern in patterns:
-            matches = re.search(pattern, text, re.MULTILINE)
+        for pattern in NAME_PATTERNS:
+            matches = pattern.search(text)
             if matches:
                 name = matches.group(1).strip()
                 cleaned_name = self.clean_student_name(name)
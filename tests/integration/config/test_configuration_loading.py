@@ -1,10 +1,14 @@
 import os
 import tempfile
+import threading
 from unittest.mock import patch
 
 import pytest
+import toml
+from fastapi.testclient import TestClient
 
 from config.config import Config, ConfigManager, get_config
+from src.controller.api.api import app
 
 
 class TestConfigurationLoading:
@@ -59,8 +63,6 @@ name = "test_db"
             original_init = Config.__init__
 
             def mock_init(self: Config) -> None:
-                import toml
-
                 if os.path.exists(temp_path):
                     toml_config = toml.load(temp_path)
                 else:
@@ -101,8 +103,6 @@ temperature = "not_a_float"
             original_init = Config.__init__
 
             def mock_init(self: Config):
-                import toml
-
                 if os.path.exists(temp_path):
                     toml_config = toml.load(temp_path)
                 else:
@@ -137,8 +137,6 @@ model = "custom_model"
             original_init = Config.__init__
 
             def mock_init(self: Config):
-                import toml
-
                 if os.path.exists(temp_path):
                     toml_config = toml.load(temp_path)
                 else:
@@ -179,8 +177,6 @@ model = "custom_model"
             ConfigManager.reset()
 
     def test_configuration_thread_safety(self) -> None:
-        import threading
-
         ConfigManager.reset()
 
         initial_config = get_config()
@@ -204,10 +200,6 @@ model = "custom_model"
         assert all(c is initial_config for c in configs)
 
     def test_configuration_with_application_context(self) -> None:
-        from fastapi.testclient import TestClient
-
-        from src.controller.api.api import app
-
         with TestClient(app) as client:
             config = get_config()
             assert isinstance(config, Config)
@@ -1,4 +1,5 @@
 import math
+import threading
 
 import pytest
 
@@ -216,8 +217,6 @@ class TestRepositoryOperations:
         assert repo.list_deliverables_by_assignment(fake_id) == []
 
     def test_concurrent_operations(self, repo: DatabaseRepository, cleanup_assignments: list[str]) -> None:
-        import threading
-
         results: list[str] = []
 
         def create_assignment(index: int) -> None:
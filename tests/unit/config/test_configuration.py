@@ -1,14 +1,25 @@
 import os
 import tempfile
+from collections.abc import Iterator
 from typing import Any
 from unittest.mock import patch
 
 import pytest
+from pytest_mock import MockerFixture
 
 from config.config import Config, ConfigManager, get_config
 from config.models import LLMConfig, ServerConfig
 
 
+@pytest.fixture
+def default_config_manager(mocker: MockerFixture) -> Iterator[None]:
+    """Load defaults into a fresh ConfigManager singleton and drop it again after the test."""
+    mocker.patch("os.path.exists", return_value=False)
+    ConfigManager.reset()
+    yield
+    ConfigManager.reset()
+
+
 class TestConfig:
     """Tests for Config class."""
 
@@ -109,28 +120,23 @@ model = "test_model"
             os.unlink(temp_path)
 
 
+@pytest.mark.usefixtures("default_config_manager")
 class TestConfigManager:
     """Tests for ConfigManager singleton."""
 
-    def setup_method(self) -> None:
-        """Reset singleton instance before each test."""
-        ConfigManager.reset()
-
     def test_singleton_behavior(self) -> None:
         """Test ConfigManager maintains singleton pattern."""
-        with patch("os.path.exists", return_value=False):
-            config1 = ConfigManager.get_config()
-            config2 = ConfigManager.get_config()
+        config1 = ConfigManager.get_config()
+        config2 = ConfigManager.get_config()
 
         assert config1 is config2
         assert isinstance(config1, Config)
 
     def test_reload_config_creates_new_instance(self) -> None:
         """Test reload_config creates a new config instance."""
-        with patch("os.path.exists", return_value=False):
-            config1 = ConfigManager.get_config()
-            config2 = ConfigManager.reload_config()
-            config3 = ConfigManager.get_config()
+        config1 = ConfigManager.get_config()
+        config2 = ConfigManager.reload_config()
+        config3 = ConfigManager.get_config()
 
         assert config1 is not config2
         assert config2 is config3
@@ -138,35 +144,29 @@ class TestConfigManager:
 
     def test_multiple_reload_calls(self) -> None:
         """Test multiple reload calls work correctly."""
-        with patch("os.path.exists", return_value=False):
-            original = ConfigManager.get_config()
-            reloaded1 = ConfigManager.reload_config()
-            reloaded2 = ConfigManager.reload_config()
-            current = ConfigManager.get_config()
+        original = ConfigManager.get_config()
+        reloaded1 = ConfigManager.reload_config()
+        reloaded2 = ConfigManager.reload_config()
+        current = ConfigManager.get_config()
 
         assert original is not reloaded1
         assert reloaded1 is not reloaded2
         assert reloaded2 is current
 
 
+@pytest.mark.usefixtures("default_config_manager")
 class TestGetConfigFunction:
     """Tests for get_config convenience function."""
 
-    def setup_method(self) -> None:
-        """Reset singleton instance before each test."""
-        ConfigManager.reset()
-
     def test_get_config_returns_config_instance(self) -> None:
         """Test get_config function returns Config instance."""
-        with patch("os.path.exists", return_value=False):
-            config = get_config()
+        config = get_config()
 
         assert isinstance(config, Config)
 
     def test_get_config_uses_singleton(self) -> None:
         """Test get_config function uses ConfigManager singleton."""
-        with patch("os.path.exists", return_value=False):
-            config1 = get_config()
-            config2 = get_config()
+        config1 = get_config()
+        config2 = get_config()
 
         assert config1 is config2
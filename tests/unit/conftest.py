@@ -0,0 +1,43 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from ferretdb_mocks import MockedFerretDBRepository
+from gridfs import GridFS
+from pymongo import MongoClient
+from pymongo.collection import Collection
+
+# Preload the deliverable service (pypdf, httpx, pymongo) and the FerretDB
+# repository (gridfs), which the factory only imports lazily, once per session
+# so collecting or re-running a single test module does not pay their import cost.
+import src.repository.db.ferretdb.repository  # noqa: F401
+import src.service.deliverable_service  # noqa: F401
+
+_UNIT_DIR = Path(__file__).parent
+_MOCKED_ATTRIBUTES: dict[str, type] = {
+    "client": MongoClient,
+    "collection": Collection,
+    "assignments_collection": Collection,
+    "files_collection": Collection,
+    "deliverables_collection": Collection,
+    "fs": GridFS,
+}
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Mark every test collected under tests/unit as a unit test."""
+    for item in items:
+        if item.path.is_relative_to(_UNIT_DIR):
+            item.add_marker(pytest.mark.unit)
+
+
+@pytest.fixture
+def repo() -> MockedFerretDBRepository:
+    """Build a FerretDB repository without running __init__ and attach fresh spec'd client, collection and GridFS mocks.
+
+    Skipping __init__ means MongoClient and GridFS never need patching.
+    """
+    repository = MockedFerretDBRepository.__new__(MockedFerretDBRepository)
+    for attribute, spec in _MOCKED_ATTRIBUTES.items():
+        setattr(repository, attribute, MagicMock(spec=spec))
+    return repository
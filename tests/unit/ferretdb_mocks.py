@@ -0,0 +1,14 @@
+from unittest.mock import MagicMock
+
+from src.repository.db.ferretdb.repository import FerretDBRepository
+
+
+class MockedFerretDBRepository(FerretDBRepository):
+    """FerretDBRepository whose client, collections and GridFS are typed as the mocks the repo fixture attaches."""
+
+    client: MagicMock
+    collection: MagicMock
+    assignments_collection: MagicMock
+    files_collection: MagicMock
+    deliverables_collection: MagicMock
+    fs: MagicMock
@@ -1,59 +1,57 @@
+from collections.abc import Mapping
+from types import MappingProxyType, SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
+import pytest
 from bson import ObjectId
+from ferretdb_mocks import MockedFerretDBRepository
+from pymongo.database import Database
 from pymongo.errors import ConnectionFailure
 
-from src.repository.db.ferretdb.repository import FerretDBRepository
 from src.repository.db.models import DocumentModel
 
+_DOC_ID_STR = "60c72b2f9b1d8e2a1c9d4b7f"
+_DOC_OID = ObjectId(_DOC_ID_STR)
+_GRIDFS_OID = ObjectId("40c72b2f9b1d8e2a1c9d4b7f")
+_FOUND_DOC: Mapping[str, Any] = MappingProxyType(
+    {
+        "_id": _DOC_OID,
+        "assignment": "test",
+        "deliverable": "test",
+        "student_name": "test",
+        "gridfs_id": _GRIDFS_OID,
+        "extension": "txt",
+    }
+)
+
 
 class TestDocumentOperations:
     """Tests for document operations and health check in FerretDBRepository."""
 
-    @patch("src.repository.db.ferretdb.repository.GridFS")
-    @patch("src.repository.db.ferretdb.repository.MongoClient")
-    def test_health_check_success(self, mock_mongo_client: MagicMock, mock_gridfs: MagicMock) -> None:
-        """Test successful health check."""
-        mock_client_instance = mock_mongo_client.return_value
-        mock_db = MagicMock()
-        mock_client_instance.__getitem__.return_value = mock_db
-        mock_client_instance.admin.command.return_value = {"ok": 1}
-
-        repo = FerretDBRepository()
-        assert repo.health() is True
-        mock_client_instance.admin.command.assert_called_once_with("ismaster")
-
-    @patch("src.repository.db.ferretdb.repository.GridFS")
-    @patch("src.repository.db.ferretdb.repository.MongoClient")
-    def test_health_check_failure(self, mock_mongo_client: MagicMock, mock_gridfs: MagicMock) -> None:
-        """Test health check when database is unreachable."""
-        mock_client_instance = mock_mongo_client.return_value
-        mock_db = MagicMock()
-        mock_client_instance.__getitem__.return_value = mock_db
-        mock_client_instance.admin.command.side_effect = ConnectionFailure
-
-        repo = FerretDBRepository()
-        assert repo.health() is False
-        mock_client_instance.admin.command.assert_called_once_with("ismaster")
-
-    @patch("src.repository.db.ferretdb.repository.GridFS")
-    @patch("src.repository.db.ferretdb.repository.MongoClient")
-    def test_store_document(self, mock_mongo_client: MagicMock, mock_gridfs: MagicMock) -> None:
+    @pytest.mark.parametrize(
+        "command_error,expected",
+        [(None, True), (ConnectionFailure, False)],
+        ids=["reachable", "unreachable"],
+    )
+    def test_health_check(
+        self, repo: MockedFerretDBRepository, command_error: type[Exception] | None, expected: bool
+    ) -> None:
+        """Test the health check against a reachable and an unreachable database."""
+        mock_admin = repo.client.admin = MagicMock(spec=Database)
+        mock_admin.command.return_value = {"ok": 1}
+        mock_admin.command.side_effect = command_error
+
+        assert repo.health() is expected
+        mock_admin.command.assert_called_once_with("ismaster")
+
+    def test_store_document(self, repo: MockedFerretDBRepository) -> None:
         """Test storing a document."""
-        mock_collection = self._setup_mock_collection(mock_mongo_client)
-
-        mock_fs = mock_gridfs.return_value
-        gridfs_id = ObjectId("40c72b2f9b1d8e2a1c9d4b7f")
-        mock_fs.put.return_value = gridfs_id
-
-        mock_insert_result = MagicMock()
-        mock_insert_result.inserted_id = "document_id"
-        mock_collection.insert_one.return_value = mock_insert_result
+        mock_collection = repo.collection
+        mock_collection.insert_one.return_value = SimpleNamespace(inserted_id="document_id")
 
-        repo = FerretDBRepository()
-        repo.collection = mock_collection
-        repo.fs = mock_fs
+        mock_fs = repo.fs
+        mock_fs.put.return_value = _GRIDFS_OID
 
         doc_id = repo.store_document("test_assignment", "test_deliverable", "test_student", b"test_document", "txt")
 
@@ -61,81 +59,43 @@ class TestDocumentOperations:
 
         mock_fs.put.assert_called_once_with(b"test_document", filename="test_student_test_assignment.txt")
 
-        call_args = mock_collection.insert_one.call_args[0][0]
-        assert call_args["assignment"] == "test_assignment"
-        assert call_args["deliverable"] == "test_deliverable"
-        assert call_args["student_name"] == "test_student"
-        assert call_args["gridfs_id"] == gridfs_id
-        assert call_args["extension"] == "txt"
-        assert call_args["file_size"] == len(b"test_document")
-
-    @patch("src.repository.db.ferretdb.repository.GridFS")
-    @patch("src.repository.db.ferretdb.repository.MongoClient")
-    def test_get_document_found(self, mock_mongo_client: MagicMock, mock_gridfs: MagicMock) -> None:
+        mock_collection.insert_one.assert_called_once_with(
+            {
+                "assignment": "test_assignment",
+                "deliverable": "test_deliverable",
+                "student_name": "test_student",
+                "gridfs_id": _GRIDFS_OID,
+                "extension": "txt",
+                "file_size": len(b"test_document"),
+            }
+        )
+
+    def test_get_document_found(self, repo: MockedFerretDBRepository) -> None:
         """Test retrieving an existing document."""
-        doc_id = ObjectId("60c72b2f9b1d8e2a1c9d4b7f")
-        gridfs_id = ObjectId("40c72b2f9b1d8e2a1c9d4b7f")
-
-        document_data: dict[str, Any] = {
-            "_id": doc_id,
-            "assignment": "test",
-            "deliverable": "test",
-            "student_name": "test",
-            "gridfs_id": gridfs_id,
-            "extension": "txt",
-        }
-
-        mock_collection = self._setup_mock_collection(mock_mongo_client)
-        mock_collection.find_one.return_value = document_data
+        mock_collection = repo.collection
+        mock_collection.find_one.return_value = dict(_FOUND_DOC)
 
-        mock_fs = mock_gridfs.return_value
-        mock_gridfs_file = MagicMock()
-        mock_gridfs_file.read.return_value = b"test content"
-        mock_fs.get.return_value = mock_gridfs_file
+        mock_fs = repo.fs
+        mock_fs.get.return_value = SimpleNamespace(read=lambda: b"test content")
 
-        repo = FerretDBRepository()
-        repo.collection = mock_collection
-        repo.fs = mock_fs
-
-        result = repo.get_document(str(doc_id))
+        result = repo.get_document(_DOC_ID_STR)
 
         assert isinstance(result, DocumentModel)
-        assert result.id == doc_id
+        assert result.id == _DOC_OID
         assert result.document == b"test content"
-        mock_collection.find_one.assert_called_once_with({"_id": doc_id})
-        mock_fs.get.assert_called_once_with(gridfs_id)
+        mock_collection.find_one.assert_called_once_with({"_id": _DOC_OID})
+        mock_fs.get.assert_called_once_with(_GRIDFS_OID)
 
-    @patch("src.repository.db.ferretdb.repository.GridFS")
-    @patch("src.repository.db.ferretdb.repository.MongoClient")
-    def test_get_document_not_found(self, mock_mongo_client: MagicMock, mock_gridfs: MagicMock) -> None:
+    def test_get_document_not_found(self, repo: MockedFerretDBRepository) -> None:
         """Test retrieving non-existent document."""
-        mock_collection = self._setup_mock_collection(mock_mongo_client)
+        mock_collection = repo.collection
         mock_collection.find_one.return_value = None
 
-        repo = FerretDBRepository()
-        repo.collection = mock_collection
-
-        result = repo.get_document("60c72b2f9b1d8e2a1c9d4b7f")
+        result = repo.get_document(_DOC_ID_STR)
         assert result is None
+        mock_collection.find_one.assert_called_once_with({"_id": _DOC_OID})
 
-    @patch("src.repository.db.ferretdb.repository.GridFS")
-    @patch("src.repository.db.ferretdb.repository.MongoClient")
-    def test_get_document_invalid_id(self, mock_mongo_client: MagicMock, mock_gridfs: MagicMock) -> None:
+    def test_get_document_invalid_id(self, repo: MockedFerretDBRepository) -> None:
         """Test retrieving document with invalid ID."""
-        mock_client = mock_mongo_client.return_value
-        mock_db = MagicMock()
-        mock_client.__getitem__.return_value = mock_db
-
-        repo = FerretDBRepository()
         result = repo.get_document("invalid-id")
         assert result is None
-
-    def _setup_mock_collection(self, mock_mongo_client: MagicMock) -> MagicMock:
-        """Setup mock MongoDB collection."""
-        mock_client = mock_mongo_client.return_value
-        mock_db = MagicMock()
-        mock_client.__getitem__.return_value = mock_db
-
-        mock_collection = MagicMock()
-        mock_db.__getitem__.return_value = mock_collection
-        return mock_collection
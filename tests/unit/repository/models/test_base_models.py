@@ -6,27 +6,28 @@ from pydantic import ValidationError
 
 from src.repository.db.models import DocumentModel, FileModel, PyObjectId
 
+_VALID_ID_STR = "60c72b2f9b1d8e2a1c9d4b7f"
+
 
 class TestPyObjectId:
     """Tests for PyObjectId custom type."""
 
-    def test_validate_valid_object_id(self) -> None:
-        """Test validating a valid ObjectId string."""
-        valid_id_str = "60c72b2f9b1d8e2a1c9d4b7f"
-        validated_id = PyObjectId.validate(valid_id_str)
+    @pytest.mark.parametrize(
+        "value",
+        [_VALID_ID_STR, ObjectId(_VALID_ID_STR)],
+        ids=["hex_string", "object_id"],
+    )
+    def test_validate_valid_object_id(self, value: str | ObjectId) -> None:
+        """Test validating a valid ObjectId string or an existing ObjectId instance."""
+        validated_id = PyObjectId.validate(value)  # type: ignore[arg-type]
         assert isinstance(validated_id, ObjectId)
-        assert validated_id == ObjectId(valid_id_str)
+        assert validated_id == ObjectId(_VALID_ID_STR)
 
-    def test_validate_invalid_object_id(self) -> None:
-        """Test that invalid ObjectId string raises error."""
+    @pytest.mark.parametrize("value", ["this-is-not-a-valid-id", "60c72b2f9b1d8e2a1c9d4b7", ""])
+    def test_validate_invalid_object_id(self, value: str) -> None:
+        """Test that invalid ObjectId strings raise an error."""
         with pytest.raises(ValueError, match="Invalid ObjectId"):
-            PyObjectId.validate("this-is-not-a-valid-id")
-
-    def test_validate_object_id_instance(self) -> None:
-        """Test validating an existing ObjectId instance."""
-        obj_id = ObjectId()
-        validated_id = PyObjectId.validate(obj_id)  # type: ignore
-        assert validated_id == obj_id
+            PyObjectId.validate(value)
 
 
 class TestDocumentModel:
@@ -86,11 +87,11 @@ class TestDocumentModel:
         """Test that document ID is serialized to string."""
         doc_id = ObjectId()
 
-        document = DocumentModel(
+        document = DocumentModel.model_construct(
             _id=doc_id, assignment="test", deliverable="test", student_name="test", document=b"test", extension="txt"
         )
 
-        dump = document.model_dump()
+        dump = document.model_dump(include={"id"})
         assert dump["id"] == str(doc_id)
 
 
@@ -150,7 +151,7 @@ class TestFileModel:
             file_type="rubric",
         )
 
-        dump = file_model.model_dump()
+        dump = file_model.model_dump(include={"id", "assignment_id"})
         assert dump["id"] == str(file_id)
         assert dump["assignment_id"] == str(assignment_id)
 
@@ -167,5 +168,5 @@ class TestFileModel:
             uploaded_at=now,
         )
 
-        dump = file_model.model_dump()
+        dump = file_model.model_dump(include={"uploaded_at"})
         assert dump["uploaded_at"] == now.isoformat()
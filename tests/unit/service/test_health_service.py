@@ -1,33 +1,45 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock
 
+import pytest
+from pytest_mock import MockerFixture
+
+from src.repository.db.base import DatabaseRepository
 from src.service.health_service import HealthService
 
 
+@pytest.fixture(scope="module")
+def _get_database_repository(module_mocker: MockerFixture) -> MagicMock:
+    """Patch the repository factory once per module."""
+    return module_mocker.patch("src.service.health_service.get_database_repository")
+
+
+@pytest.fixture
+def patched_repo(_get_database_repository: MagicMock) -> Mock:
+    """Have the patched factory hand out a fresh spec'd repository for each test."""
+    repo = Mock(spec=DatabaseRepository)
+    _get_database_repository.return_value = repo
+    return repo
+
+
 class TestHealthService:
     """Tests for HealthService."""
 
-    @patch("src.service.health_service.get_database_repository")
-    def test_check_health_when_healthy(self, mock_get_repo: MagicMock) -> None:
+    def test_check_health_when_healthy(self, patched_repo: Mock) -> None:
         """Test health check when database is healthy."""
-        mock_repo = MagicMock()
-        mock_repo.health.return_value = True
-        mock_get_repo.return_value = mock_repo
+        patched_repo.health.return_value = True
 
         service = HealthService()
         is_healthy = service.check_health()
 
         assert is_healthy is True
-        mock_repo.health.assert_called_once()
+        patched_repo.health.assert_called_once()
 
-    @patch("src.service.health_service.get_database_repository")
-    def test_check_health_when_unhealthy(self, mock_get_repo: MagicMock) -> None:
+    def test_check_health_when_unhealthy(self, patched_repo: Mock) -> None:
         """Test health check when database is unhealthy."""
-        mock_repo = MagicMock()
-        mock_repo.health.return_value = False
-        mock_get_repo.return_value = mock_repo
+        patched_repo.health.return_value = False
 
         service = HealthService()
         is_healthy = service.check_health()
 
         assert is_healthy is False
-        mock_repo.health.assert_called_once()
+        patched_repo.health.assert_called_once()